@@ -0,0 +1,400 @@
+"""Read-only JSON API over the attendance data files.
+
+Runs alongside the Streamlit pages and reads the same CSV / Excel files.
+Intended for ERP and timetable integrations that poll for changes.
+
+    python api.py --host 127.0.0.1 --port 8502
+
+Endpoints (all GET):
+    /sessions?since=<CreatedAt>
+    /sessions/<SessionID>/attendance?since=<row>
+    /summary?class=<ClassID>&subject=<SubjectID>
+
+Every response carries an ETag; send it back as If-None-Match to get a
+304 with no body while the underlying files are unchanged.
+
+The /sessions cursor only follows CreatedAt, so later edits to a session
+row (e.g. `Active` being flipped by the Admin or Teacher pages) are not
+synced incrementally. Each session includes `ExpiresAt`; use it rather
+than `Active`, or re-fetch /sessions without `since` to reconcile.
+Session codes are never returned.
+
+The service has no authentication. Keep it bound to loopback (the
+default) and front it with the ERP's own access control if needed.
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+import traceback
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+# =====================================================
+# FILE PATHS
+# =====================================================
+SESSIONS_FILE = "sessions.csv"
+ATTENDANCE_FILE = "attendance.csv"
+STUDENTS_FILE = "Students.xlsx"
+CLASSES_FILE = "classes.csv"
+SUBJECTS_FILE = "subjects.csv"
+
+SESSION_COLS = [
+    "SessionID", "TeacherID", "ClassID", "SubjectID",
+    "SessionCode", "CreatedAt", "ExpiryMinutes", "Active"
+]
+# SessionCode is deliberately left out: it is the only check on marking
+PUBLIC_SESSION_COLS = [
+    "SessionID", "TeacherID", "ClassID", "SubjectID",
+    "CreatedAt", "ExpiryMinutes", "ExpiresAt", "Active"
+]
+ATTENDANCE_COLS = ["Date", "SessionID", "RollNumber"]
+
+MAX_CACHED_RESPONSES = 256
+
+
+class NotFound(Exception):
+    pass
+
+
+class DataUnavailable(Exception):
+    pass
+
+
+# =====================================================
+# SAFE LOAD
+# =====================================================
+def load_csv(path, required_cols):
+    if os.path.exists(path):
+        df = pd.read_csv(path, dtype=str).fillna("")
+    else:
+        df = pd.DataFrame(columns=required_cols)
+    for col in required_cols:
+        if col not in df.columns:
+            df[col] = ""
+    return df[required_cols]
+
+
+def expires_at(row):
+    try:
+        created = datetime.fromisoformat(row["CreatedAt"])
+        return (created + timedelta(minutes=int(row["ExpiryMinutes"]))).isoformat()
+    except (TypeError, ValueError):
+        return ""
+
+
+def load_sessions():
+    sessions = load_csv(SESSIONS_FILE, SESSION_COLS)
+    sessions = sessions.sort_values("CreatedAt", kind="stable")
+    sessions["ExpiresAt"] = (
+        sessions.apply(expires_at, axis=1) if not sessions.empty else ""
+    )
+    return sessions
+
+
+def load_attendance():
+    attendance = load_csv(ATTENDANCE_FILE, ATTENDANCE_COLS)
+    attendance["RollNumber"] = attendance["RollNumber"].str.strip()
+    # Row position in the append-only attendance file is the sync cursor
+    attendance = attendance.reset_index(drop=True)
+    attendance.insert(0, "Row", attendance.index + 1)
+    return {
+        "rows": attendance,
+        "by_session": {
+            sid: grp for sid, grp in attendance.groupby("SessionID")
+        },
+    }
+
+
+def load_students():
+    cols = ["RollNumber", "EnrollmentNumber", "StudentName", "ClassID"]
+    if not os.path.exists(STUDENTS_FILE):
+        return pd.DataFrame(columns=cols)
+    df = pd.read_excel(STUDENTS_FILE, dtype=str).fillna("")
+    for col in cols:
+        if col not in df.columns:
+            df[col] = ""
+    df["RollNumber"] = df["RollNumber"].str.strip()
+    return df[cols]
+
+
+# name -> (path, loader)
+SOURCES = {
+    "sessions": (SESSIONS_FILE, load_sessions),
+    "attendance": (ATTENDANCE_FILE, load_attendance),
+    "students": (STUDENTS_FILE, load_students),
+    "classes": (CLASSES_FILE, lambda: load_csv(CLASSES_FILE, ["ClassID", "ClassName"])),
+    "subjects": (SUBJECTS_FILE, lambda: load_csv(SUBJECTS_FILE, ["SubjectID", "SubjectName", "ClassID"])),
+}
+
+
+# =====================================================
+# IN-MEMORY CACHE (INVALIDATED PER FILE)
+# =====================================================
+def file_signature(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+class DataCache:
+    """Parsed data files and rendered responses.
+
+    Each file is re-parsed only when its own mtime/size changes, and each
+    response is keyed on the signatures of just the files it reads. The
+    lock only guards the dicts; parsing and rendering happen outside it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files = {}  # name -> (signature, parsed)
+        self._responses = OrderedDict()  # key -> (signatures, body, etag)
+
+    def _load(self, name):
+        path, loader = SOURCES[name]
+        signature = file_signature(path)
+        with self._lock:
+            cached = self._files.get(name)
+        if cached and cached[0] == signature:
+            return cached
+        try:
+            parsed = loader()
+        except Exception as e:
+            # A file mid-rewrite can fail to parse; fall back to the last
+            # good copy and retry on the next request.
+            if cached:
+                return cached
+            raise DataUnavailable(f"{path}: {e!r}") from e
+        with self._lock:
+            self._files[name] = (signature, parsed)
+        return signature, parsed
+
+    def get(self, key, deps, build):
+        """Return (body, etag) for key, building it with build(data) if needed."""
+        signatures = tuple(file_signature(SOURCES[name][0]) for name in deps)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached and cached[0] == signatures:
+                self._responses.move_to_end(key)
+                return cached[1], cached[2]
+
+        loaded = {name: self._load(name) for name in deps}
+        signatures = tuple(loaded[name][0] for name in deps)
+        payload = build({name: loaded[name][1] for name in deps})
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+
+        with self._lock:
+            self._responses[key] = (signatures, body, etag)
+            self._responses.move_to_end(key)
+            while len(self._responses) > MAX_CACHED_RESPONSES:
+                self._responses.popitem(last=False)
+        return body, etag
+
+
+CACHE = DataCache()
+
+
+# =====================================================
+# RESPONSE BUILDERS
+# =====================================================
+def build_sessions(data, since):
+    sessions = data["sessions"]
+    if since:
+        sessions = sessions[sessions["CreatedAt"] > since]
+    cursor = sessions["CreatedAt"].iloc[-1] if not sessions.empty else since
+    return {
+        "sessions": sessions[PUBLIC_SESSION_COLS].to_dict(orient="records"),
+        "cursor": cursor,
+    }
+
+
+def build_session_attendance(data, session_id, since):
+    attendance = data["attendance"]
+    rows = attendance["by_session"].get(session_id)
+    if rows is None:
+        rows = attendance["rows"].iloc[0:0]
+    rows = rows[rows["Row"] > since]
+    cursor = int(rows["Row"].iloc[-1]) if not rows.empty else since
+    return {
+        "session_id": session_id,
+        "attendance": rows.drop(columns=["Row"]).to_dict(orient="records"),
+        "cursor": cursor,
+    }
+
+
+def build_summary(data, class_id, subject_id):
+    classes = data["classes"]
+    subjects = data["subjects"]
+    if not (classes["ClassID"] == class_id).any():
+        raise NotFound(f"Unknown class '{class_id}'")
+    if not (
+        (subjects["SubjectID"] == subject_id) &
+        (subjects["ClassID"] == class_id)
+    ).any():
+        raise NotFound(f"Unknown subject '{subject_id}' for class '{class_id}'")
+
+    sessions = data["sessions"]
+    subject_sessions = sessions[
+        (sessions["ClassID"] == class_id) &
+        (sessions["SubjectID"] == subject_id)
+    ]
+    session_ids = set(subject_sessions["SessionID"])
+    total_sessions = len(session_ids)
+
+    att = data["attendance"]["rows"]
+    att = att[att["SessionID"].isin(session_ids)]
+    present = (
+        att.drop_duplicates(["SessionID", "RollNumber"])
+        .groupby("RollNumber").size().to_dict()
+    )
+
+    students = data["students"]
+    students = students[students["ClassID"] == class_id]
+
+    rows = []
+    for _, s in students.iterrows():
+        count = int(present.get(s["RollNumber"], 0))
+        pct = round(count / total_sessions * 100, 2) if total_sessions else 0.0
+        rows.append({
+            "RollNumber": s["RollNumber"],
+            "EnrollmentNumber": s["EnrollmentNumber"],
+            "StudentName": s["StudentName"],
+            "TotalPresent": count,
+            "Attendance%": pct,
+        })
+
+    return {
+        "class_id": class_id,
+        "subject_id": subject_id,
+        "total_sessions": total_sessions,
+        "students": rows,
+    }
+
+
+# =====================================================
+# HTTP HANDLER
+# =====================================================
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "AttendanceAPI/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        try:
+            route = self._route(parts, query)
+        except ValueError as e:
+            self._send_error(400, str(e))
+            return
+
+        if route is None:
+            self._send_error(404, "Not found")
+            return
+
+        key, deps, build = route
+        try:
+            body, etag = CACHE.get(key, deps, build)
+        except NotFound as e:
+            self._send_error(404, str(e))
+            return
+        except DataUnavailable as e:
+            self.log_error("Failed to load data files: %s", e)
+            self._send_error(503, "Data files temporarily unavailable, retry shortly")
+            return
+        except Exception:
+            self.log_error("Error building response for %s", self.path)
+            traceback.print_exc()
+            self._send_error(500, "Internal server error")
+            return
+
+        if etag in self._if_none_match():
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self, parts, query):
+        if parts == ["sessions"]:
+            since = query.get("since", "")
+            return (
+                ("sessions", since),
+                ["sessions"],
+                lambda d: build_sessions(d, since),
+            )
+
+        if len(parts) == 3 and parts[0] == "sessions" and parts[2] == "attendance":
+            session_id = parts[1]
+            try:
+                since = int(query.get("since", "0") or 0)
+            except ValueError:
+                raise ValueError("'since' must be an integer row cursor")
+            return (
+                ("attendance", session_id, since),
+                ["attendance"],
+                lambda d: build_session_attendance(d, session_id, since),
+            )
+
+        if parts == ["summary"]:
+            class_id = query.get("class")
+            subject_id = query.get("subject")
+            if not class_id or not subject_id:
+                raise ValueError("'class' and 'subject' are required")
+            return (
+                ("summary", class_id, subject_id),
+                ["classes", "subjects", "sessions", "attendance", "students"],
+                lambda d: build_summary(d, class_id, subject_id),
+            )
+
+        return None
+
+    def _if_none_match(self):
+        header = self.headers.get("If-None-Match", "")
+        return {tag.strip() for tag in header.split(",") if tag.strip()}
+
+    def _send_error(self, status, message):
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+def main():
+    parser = argparse.ArgumentParser(description="Read-only attendance JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    print(f"Serving attendance API on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,60 @@ PHOTO_DIR = "attendance_photos"
 
 os.makedirs(PHOTO_DIR, exist_ok=True)
 
+MAX_CANDIDATES = 15
+MAX_PREFIX_LEN = 12
+
+# =====================================================
+# STUDENT INDEX (CACHED PER CLASS, REBUILT ON FILE CHANGE)
+# =====================================================
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_student_index(mtime, class_id):
+    """Return (roll -> student dict, lowercase prefix -> [rolls]) for a class.
+
+    `mtime` is only part of the cache key so edits to Students.xlsx
+    rebuild the index. The result is shared across reruns; treat it as
+    read-only. Each student dict carries its normalized search keys
+    under "_keys".
+    """
+    df = pd.read_excel(STUDENTS_FILE, dtype=str).fillna("")
+    df = df[df["ClassID"] == class_id]
+
+    by_roll = {}
+    prefix_index = {}
+
+    for rec in df.to_dict(orient="records"):
+        roll = rec["RollNumber"].strip()
+        if not roll or roll in by_roll:
+            continue
+
+        name = " ".join(rec["StudentName"].lower().split())
+        keys = {roll.lower(), rec["EnrollmentNumber"].strip().lower(), name}
+        keys.update(name.split())
+        keys.discard("")
+        rec["_keys"] = tuple(keys)
+        by_roll[roll] = rec
+
+        seen = set()
+        for key in keys:
+            for i in range(1, min(len(key), MAX_PREFIX_LEN) + 1):
+                seen.add(key[:i])
+        for prefix in seen:
+            prefix_index.setdefault(prefix, []).append(roll)
+
+    return by_roll, prefix_index
+
+
+def search_students(query, by_roll, prefix_index):
+    q = " ".join(query.lower().split())
+    rolls = prefix_index.get(q[:MAX_PREFIX_LEN], [])
+    if len(q) > MAX_PREFIX_LEN:
+        # Index stops at MAX_PREFIX_LEN chars; narrow the bucket directly
+        rolls = [
+            r for r in rolls
+            if any(k.startswith(q) for k in by_roll[r]["_keys"])
+        ]
+    return rolls[:MAX_CANDIDATES]
+
 # =====================================================
 # SESSION STATE LOCK (DEVICE LEVEL)
 # =====================================================
@@ -101,22 +155,36 @@ if not os.path.exists(STUDENTS_FILE):
     st.error("Students file missing")
     st.stop()
 
-students = pd.read_excel(STUDENTS_FILE)
-students = students[students["ClassID"].astype(str) == str(session["ClassID"])]
+by_roll, prefix_index = load_student_index(
+    os.path.getmtime(STUDENTS_FILE), str(session["ClassID"])
+)
 
-if students.empty:
+if not by_roll:
     st.error("No students found for this class")
     st.stop()
 
 # =====================================================
 # STUDENT SELECTION
 # =====================================================
+query = st.text_input("🔍 Search Roll Number, Enrollment or Name")
+
+if not query.strip():
+    st.info("Start typing your roll number, enrollment number or name.")
+    st.stop()
+
+candidates = search_students(query, by_roll, prefix_index)
+
+if not candidates:
+    st.warning("No matching student found")
+    st.stop()
+
 roll = st.selectbox(
     "Select Roll Number",
-    students["RollNumber"].astype(str)
+    candidates,
+    format_func=lambda r: f"{r} – {by_roll[r]['StudentName']}"
 )
 
-student = students[students["RollNumber"].astype(str) == roll].iloc[0]
+student = by_roll[roll]
 
 st.text_input("Student Name", student["StudentName"], disabled=True)
 st.text_input("Enrollment Number", student["EnrollmentNumber"], disabled=True)